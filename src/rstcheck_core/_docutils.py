@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import importlib
 import logging
+import sys
 import typing as t
 
 import docutils.nodes
@@ -35,23 +35,30 @@ def ignore_role(  # noqa: PLR0913
     inliner: docutils.parsers.rst.states.Inliner,  # noqa: ARG001
     options: t.Mapping[str, t.Any] | None = None,  # noqa: ARG001
     content: t.Sequence[str] | None = None,  # noqa: ARG001
-) -> tuple[
-    t.Sequence[docutils.nodes.reference], t.Sequence[docutils.nodes.reference]
-]:  # pragma: no cover
+) -> tuple[t.Sequence[docutils.nodes.reference], t.Sequence[docutils.nodes.reference]]:
     """Stub for unknown roles."""
-    return ([], [])
+    # NOTE: docutils' inliner concatenates its message list with the returned messages,
+    # so they must be a list. The nodes are only read and can be a shared empty tuple.
+    return ((), [])
 
 
-def clean_docutils_directives_and_roles_cache() -> None:  # pragma: no cover
-    """Clean docutils' directives and roles cache by reloading their modules.
+_CANONICAL_ROLES: dict[str, t.Any] = dict(
+    docutils.parsers.rst.roles._role_registry  # type: ignore[attr-defined]  # noqa: SLF001
+)
 
-    Reloads:
-    - :py:mod:`docutils.parsers.rst.directives`
-    - :py:mod:`docutils.parsers.rst.roles`
+
+def clean_docutils_directives_and_roles_cache() -> None:
+    """Clean docutils' directives and roles cache.
+
+    Clears the registered directives and roles of :py:mod:`docutils.parsers.rst.directives` and
+    :py:mod:`docutils.parsers.rst.roles` and restores docutils' canonical roles.
     """
-    logger.info("Reload module docutils.parsers.rst.directives/roles")
-    importlib.reload(docutils.parsers.rst.directives)
-    importlib.reload(docutils.parsers.rst.roles)
+    logger.info("Clean docutils.parsers.rst.directives/roles cache")
+    docutils.parsers.rst.directives._directives.clear()  # type: ignore[attr-defined]  # noqa: SLF001
+    docutils.parsers.rst.roles._roles.clear()  # type: ignore[attr-defined]  # noqa: SLF001
+    role_registry = docutils.parsers.rst.roles._role_registry  # type: ignore[attr-defined]  # noqa: SLF001
+    role_registry.clear()
+    role_registry.update(_CANONICAL_ROLES)
 
 
 def ignore_directives_and_roles(directives: list[str], roles: list[str]) -> None:
@@ -60,11 +67,14 @@ def ignore_directives_and_roles(directives: list[str], roles: list[str]) -> None
     :param directives: Directives to ignore
     :param roles: Roles to ignore
     """
-    for directive in directives:
-        docutils.parsers.rst.directives.register_directive(directive, IgnoredDirective)
-
-    for role in roles:
-        docutils.parsers.rst.roles.register_local_role(role, ignore_role)
+    # NOTE: Bulk version of ``register_directive``/``register_local_role`` with interned names
+    docutils.parsers.rst.directives._directives.update(  # type: ignore[attr-defined]  # noqa: SLF001
+        dict.fromkeys(map(sys.intern, directives), IgnoredDirective)
+    )
+    docutils.parsers.rst.roles.set_implicit_options(ignore_role)
+    docutils.parsers.rst.roles._roles.update(  # type: ignore[attr-defined]  # noqa: SLF001
+        dict.fromkeys((sys.intern(role.lower()) for role in roles), ignore_role)
+    )
 
 
 def register_substitutions_and_targets(substitutions: dict[str, str], targets: dict[str, str]) -> None:
@@ -101,9 +111,10 @@ class CodeBlockDirective(docutils.parsers.rst.Directive):
             language = self.arguments[0]
         except IndexError:
             language = ""
-        code = "\n".join(self.content)
+        content = self.content
+        code = content[0] if len(content) == 1 else "\n".join(content)
         literal = docutils.nodes.literal_block(code, code)
-        literal["classes"].append("code-block")
+        literal["classes"] = ["code-block"]
         literal["language"] = language
         return [literal]
 
@@ -136,63 +147,46 @@ def register_code_directive(
             docutils.parsers.rst.directives.register_directive("sourcecode", CodeBlockDirective)
 
 
-# Custom substitution handler for combined substitution and link references
-def handle_substitution_reference(
-    name: str,
-    rawtext: str,
-    text: str,
-    lineno: int,
-    inliner: docutils.parsers.rst.states.Inliner,
-    options: t.Mapping[str, t.Any] | None = None,
-    content: t.Sequence[str] | None = None,
-) -> tuple[list[docutils.nodes.Node], list[docutils.nodes.system_message]]:
-    """Handle substitution references.
-    
-    This function is used to handle substitution references in RST files.
-    It creates a substitution node with the given name and text.
-    
-    :param name: The name of the substitution
-    :param rawtext: The raw text of the substitution reference
-    :param text: The text of the substitution
-    :param lineno: The line number of the substitution reference
-    :param inliner: The inliner object
-    :param options: Options for the substitution
-    :param content: Content for the substitution
-    :return: A tuple of nodes and system messages
+_SUBSTITUTION_TEXT: dict[str, str] = {}
+
+
+class _SubstitutionRole:
+    """Role for one registered substitution.
+
+    The role keeps only the substitution name and looks up the text in
+    :py:data:`_SUBSTITUTION_TEXT`, so it also resolves when called through an alias
+    (``.. role:: alias(substitution-name)``).
     """
-    logger.debug("Handling substitution reference: |%s|", name)
-    options = options or {}
-    content = content or []
-    
-    # Create a text node with the substitution text
-    node = docutils.nodes.Text(text)
-    
-    return [node], []
+
+    def __init__(self, substitution_name: str) -> None:
+        self.substitution_name = substitution_name
+
+    def __call__(  # noqa: PLR0913
+        self,
+        name: str,  # noqa: ARG002
+        rawtext: str,  # noqa: ARG002
+        text: str,  # noqa: ARG002
+        lineno: int,  # noqa: ARG002
+        inliner: docutils.parsers.rst.states.Inliner,  # noqa: ARG002
+        options: t.Mapping[str, t.Any] | None = None,  # noqa: ARG002
+        content: t.Sequence[str] | None = None,  # noqa: ARG002
+    ) -> tuple[list[docutils.nodes.Node], list[docutils.nodes.system_message]]:
+        """Return the substitution text."""
+        return [docutils.nodes.Text(_SUBSTITUTION_TEXT[self.substitution_name])], []
 
 
-# Register a custom substitution handler
 def register_substitution_handler(name: str, text: str) -> None:
     """Register a custom substitution handler.
-    
+
     This function registers a custom substitution handler for the given name.
     The handler will replace the substitution reference with the given text.
-    
+
     :param name: The name of the substitution
     :param text: The text to replace the substitution with
     """
     logger.debug("Registering substitution handler for: |%s|", name)
-    
-    # Create a handler function that returns the given text
-    def handler(
-        name: str,
-        rawtext: str,
-        text: str,
-        lineno: int,
-        inliner: docutils.parsers.rst.states.Inliner,
-        options: t.Mapping[str, t.Any] | None = None,
-        content: t.Sequence[str] | None = None,
-    ) -> tuple[list[docutils.nodes.Node], list[docutils.nodes.system_message]]:
-        return [docutils.nodes.Text(text)], []
-    
-    # Register the handler as a role
-    docutils.parsers.rst.roles.register_local_role(f"substitution-{name}", handler)
+    _SUBSTITUTION_TEXT[name] = text
+    docutils.parsers.rst.roles.register_local_role(
+        f"substitution-{name}",
+        _SubstitutionRole(name),  # type: ignore[arg-type]
+    )
@@ -3,84 +3,249 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
+import os
 import pathlib
-import tempfile
+import re
+import sys
 import typing as t
 
 from . import _docutils, _extras
 
-if _extras.SPHINX_INSTALLED:
+if t.TYPE_CHECKING:
     import sphinx.application
-    import sphinx.domains.c
-    import sphinx.domains.cpp
-    import sphinx.domains.javascript
-    import sphinx.domains.python
-    import sphinx.domains.std
-    import sphinx.util.docutils
+    import sphinx.config
 
 
 logger = logging.getLogger(__name__)
 
 
+_PROLOG_RE = re.compile(
+    r"^[ \t]*\.\. (?:\|(?P<sub>[^|\n]+)\| replace:: (?P<val>.+)|_(?P<tgt>[^:\n]+): (?P<href>.+))$",
+    re.MULTILINE,
+)
+
+
+_POSITIVE_CONFDIR: dict[str, pathlib.Path] = {}
+_NEGATIVE_CONFDIR: set[str] = set()
+
+
+def _has_conf_py(directory: str) -> bool:
+    """Check if a directory contains a conf.py file.
+
+    The directory is listed once with :py:func:`os.scandir` instead of issuing a separate
+    ``stat`` call for the conf.py path.
+
+    :param directory: Directory to check
+    :return: If a conf.py file is in the directory
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name == "conf.py" for entry in entries)
+    except OSError:
+        return False
+
+
 def find_sphinx_confdir(source_file_dir: pathlib.Path) -> pathlib.Path | None:
     """Find directory containing conf.py file by traversing up the directory tree.
-    
+
+    The result is cached for every directory visited during the search, so that source files
+    sharing ancestor directories do not repeat the lookup.
+
     :param source_file_dir: Directory to start searching from
     :return: Path to directory containing conf.py or None if not found
     """
-    current_dir = source_file_dir
-    while current_dir != current_dir.parent:  # Stop at filesystem root
-        conf_path = current_dir / "conf.py"
-        if conf_path.exists():
-            logger.debug("Found conf.py at %s", conf_path)
-            return current_dir
-        current_dir = current_dir.parent
-    
-    logger.debug("No conf.py found in directory tree starting from %s", source_file_dir)
-    return None
-
-
-def create_dummy_sphinx_app(confdir: pathlib.Path | None = None) -> sphinx.application.Sphinx:
+    start_dir = str(source_file_dir)
+    if start_dir in _NEGATIVE_CONFDIR:
+        return None
+    if start_dir in _POSITIVE_CONFDIR:
+        return _POSITIVE_CONFDIR[start_dir]
+
+    current_dir = os.path.realpath(start_dir)
+    # NOTE: Relative paths depend on the working directory and are not safe to cache
+    visited: list[str] = [start_dir] if os.path.isabs(start_dir) else []
+    confdir: pathlib.Path | None = None
+    while current_dir not in _NEGATIVE_CONFDIR:
+        if current_dir in _POSITIVE_CONFDIR:
+            confdir = _POSITIVE_CONFDIR[current_dir]
+            break
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:  # Stop at filesystem root
+            break
+        visited.append(current_dir)
+        if _has_conf_py(current_dir):
+            logger.debug("Found conf.py in %s", current_dir)
+            confdir = pathlib.Path(current_dir)
+            break
+        current_dir = parent_dir
+
+    if confdir is None:
+        _NEGATIVE_CONFDIR.update(visited)
+        logger.debug("No conf.py found in directory tree starting from %s", source_file_dir)
+    else:
+        _POSITIVE_CONFDIR.update(dict.fromkeys(visited, confdir))
+    return confdir
+
+
+def create_dummy_sphinx_app(
+    confdir: pathlib.Path | None = None, temp_dir: pathlib.Path | None = None
+) -> sphinx.application.Sphinx:
     """Create a dummy sphinx instance with temp dirs.
-    
+
     :param confdir: Path to directory containing conf.py file; defaults to :py:obj:`None`
+    :param temp_dir: Directory for the build output; the caller is responsible for its removal;
+        if :py:obj:`None` a new temporary directory is created, which is removed at interpreter
+        exit; defaults to :py:obj:`None`
     :return: Sphinx application instance
     """
+    import sphinx.application
+
+    if temp_dir is None:
+        import atexit
+        import shutil
+        import tempfile
+
+        temp_dir = pathlib.Path(tempfile.mkdtemp())
+        atexit.register(shutil.rmtree, temp_dir, ignore_errors=True)
+
     logger.debug("Create dummy sphinx application with confdir: %s", confdir)
-    with tempfile.TemporaryDirectory() as temp_dir:
-        outdir = pathlib.Path(temp_dir) / "_build"
-        app = sphinx.application.Sphinx(
-            srcdir=str(confdir) if confdir is not None else temp_dir,
-            confdir=confdir,
-            outdir=str(outdir),
-            doctreedir=str(outdir),
-            buildername="dummy",
-            # NOTE: https://github.com/sphinx-doc/sphinx/issues/10483
-            status=None,
-        )
-        
-        # Debug: Log substitutions and link targets loaded from conf.py
-        if confdir is not None and hasattr(app.env, 'config'):
-            logger.debug("Sphinx app created with config: %s", app.env.config)
-            
-            # Debug: Check for substitutions in the Sphinx environment
-            if hasattr(app.env, 'substitutions'):
-                logger.debug("Substitutions in Sphinx env: %s", app.env.substitutions)
+    outdir = temp_dir / "_build"
+    app = sphinx.application.Sphinx(
+        srcdir=str(confdir) if confdir is not None else str(temp_dir),
+        confdir=confdir,
+        outdir=str(outdir),
+        doctreedir=str(outdir),
+        buildername="dummy",
+        # NOTE: https://github.com/sphinx-doc/sphinx/issues/10483
+        status=None,
+    )
+
+    # Debug: Log substitutions and link targets loaded from conf.py
+    if confdir is not None and hasattr(app.env, 'config'):
+        logger.debug("Sphinx app created with config: %s", app.env.config)
+
+        # Debug: Check for substitutions in the Sphinx environment
+        if hasattr(app.env, 'substitutions'):
+            logger.debug("Substitutions in Sphinx env: %s", app.env.substitutions)
+        else:
+            logger.debug("No substitutions attribute in Sphinx env")
+
+        # Debug: Check for link targets in the Sphinx environment
+        if hasattr(app.env, 'domains'):
+            std_domain = app.env.get_domain('std')
+            if hasattr(std_domain, 'labels'):
+                logger.debug("Link targets in Sphinx env: %s", std_domain.labels)
             else:
-                logger.debug("No substitutions attribute in Sphinx env")
-                
-            # Debug: Check for link targets in the Sphinx environment
-            if hasattr(app.env, 'domains'):
-                std_domain = app.env.get_domain('std')
-                if hasattr(std_domain, 'labels'):
-                    logger.debug("Link targets in Sphinx env: %s", std_domain.labels)
-                else:
-                    logger.debug("No labels attribute in std domain")
+                logger.debug("No labels attribute in std domain")
+        else:
+            logger.debug("No domains attribute in Sphinx env")
+
+    return app
+
+
+_PROLOG_CACHE: dict[pathlib.Path, tuple[dict[str, str], dict[str, str]]] = {}
+
+
+def _extract_substitutions_and_targets(
+    config: sphinx.config.Config,
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Extract substitutions and link targets from a Sphinx config.
+
+    Substitutions and link targets are taken from ``rst_prolog`` and substitutions additionally
+    from ``html_context["substitutions"]``.
+
+    :param config: Sphinx config loaded from conf.py
+    :return: Tuple of substitutions and link targets
+    """
+    substitutions: dict[str, str] = {}
+    targets: dict[str, str] = {}
+
+    # Extract substitutions and link targets from rst_prolog
+    if hasattr(config, 'rst_prolog') and config.rst_prolog:
+        logger.debug("Extracting substitutions and link targets from rst_prolog")
+
+        for match in _PROLOG_RE.finditer(config.rst_prolog):
+            if match["sub"] is not None:
+                substitutions[match["sub"]] = match["val"]
             else:
-                logger.debug("No domains attribute in Sphinx env")
-        
-        return app
+                targets[match["tgt"]] = match["href"]
+
+        if substitutions:
+            logger.debug("Found substitutions in rst_prolog: %s", substitutions)
+        if targets:
+            logger.debug("Found link targets in rst_prolog: %s", targets)
+
+    # Extract substitutions from html_context
+    if hasattr(config, 'html_context') and config.html_context:
+        if 'substitutions' in config.html_context:
+            subs = config.html_context['substitutions']
+            logger.debug("Found substitutions in html_context: %s", subs)
+            for name, value in subs.items():
+                substitutions[name] = value
+
+    return (substitutions, targets)
+
+
+_DEFAULT_SPHINX_REGISTRATIONS: (
+    tuple[dict[str, t.Any], dict[str, t.Any], dict[str, t.Any]] | None
+) = None
+
+
+def _register_default_sphinx_directives_and_roles() -> None:
+    """Register the directives and roles a Sphinx app without conf.py registers with docutils.
+
+    A dummy Sphinx app is only created on the first call to record its registrations, including
+    the canonical roles it overrides (e.g. ``code``). Later calls replay the recorded registrations
+    instead of creating a new app.
+    """
+    global _DEFAULT_SPHINX_REGISTRATIONS  # noqa: PLW0603
+
+    import sphinx.util.docutils
+
+    if _DEFAULT_SPHINX_REGISTRATIONS is None:
+        import shutil
+        import tempfile
+
+        directives = sphinx.util.docutils.directives._directives  # type: ignore[attr-defined]  # noqa: SLF001
+        roles = sphinx.util.docutils.roles._roles  # type: ignore[attr-defined]  # noqa: SLF001
+        role_registry = sphinx.util.docutils.roles._role_registry  # type: ignore[attr-defined]  # noqa: SLF001
+        saved_directives = dict(directives)
+        saved_roles = dict(roles)
+        saved_role_registry = dict(role_registry)
+        directives.clear()
+        roles.clear()
+        role_registry.clear()
+        role_registry.update(_docutils._CANONICAL_ROLES)  # noqa: SLF001
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            create_dummy_sphinx_app(None, pathlib.Path(temp_dir))
+            registrations = (
+                dict(directives),
+                dict(roles),
+                {
+                    name: role
+                    for name, role in role_registry.items()
+                    if _docutils._CANONICAL_ROLES.get(name) is not role  # noqa: SLF001
+                },
+            )
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            directives.update(saved_directives)
+            roles.update(saved_roles)
+            role_registry.clear()
+            role_registry.update(saved_role_registry)
+
+        _DEFAULT_SPHINX_REGISTRATIONS = registrations
+
+    (default_directives, default_roles, default_canonical_roles) = _DEFAULT_SPHINX_REGISTRATIONS
+    sphinx.util.docutils.directives._directives.update(default_directives)  # type: ignore[attr-defined]  # noqa: SLF001
+    sphinx.util.docutils.roles._roles.update(default_roles)  # type: ignore[attr-defined]  # noqa: SLF001
+    sphinx.util.docutils.roles._role_registry.update(default_canonical_roles)  # type: ignore[attr-defined]  # noqa: SLF001
+
+
+_PATCHED_BUILTIN_EXTENSIONS = False
 
 
 @contextlib.contextmanager
@@ -88,109 +253,120 @@ def load_sphinx_if_available(
     source_file_dir: pathlib.Path | None = None
 ) -> t.Generator[sphinx.application.Sphinx | None, None, None]:
     """Contextmanager to register Sphinx directives and roles if sphinx is available.
-    
+
+    A Sphinx application is only created when a conf.py is found for ``source_file_dir``.
+
     :param source_file_dir: Directory of the source file being checked; defaults to :py:obj:`None`
-    :yield: Sphinx application or None if Sphinx is not installed
+    :yield: Sphinx application or None if Sphinx is not installed or no conf.py is found
     """
+    global _PATCHED_BUILTIN_EXTENSIONS  # noqa: PLW0603
+
     app = None
-    if _extras.SPHINX_INSTALLED:
-        confdir = None
-        if source_file_dir is not None:
-            confdir = find_sphinx_confdir(source_file_dir)
-            logger.debug("Found confdir: %s for source_file_dir: %s", confdir, source_file_dir)
-        
-        app = create_dummy_sphinx_app(confdir)
-        
-        # NOTE: Hack to prevent sphinx warnings for overwriting registered nodes; see #113
-        sphinx.application.builtin_extensions = [
-            e
-            for e in sphinx.application.builtin_extensions
-            if e != "sphinx.addnodes"  # type: ignore[assignment]
-        ]
-        
-        # Extract and register substitutions and link targets from conf.py
-        if app is not None and confdir is not None and hasattr(app.env, 'config'):
-            # Initialize dictionaries to store substitutions and targets
-            substitutions = {}
-            targets = {}
-            
-            # Extract substitutions from rst_prolog
-            if hasattr(app.env.config, 'rst_prolog') and app.env.config.rst_prolog:
-                logger.debug("Extracting substitutions and link targets from rst_prolog")
-                import re
-                
-                # Extract substitutions
-                sub_pattern = r'\.\. \|([^|]+)\| replace:: (.+)'
-                subs = re.findall(sub_pattern, app.env.config.rst_prolog)
-                if subs:
-                    logger.debug("Found substitutions in rst_prolog: %s", subs)
-                    for name, value in subs:
-                        substitutions[name] = value
-                        # Register individual substitution handler
-                        _docutils.register_substitution_handler(name, value)
-                
-                # Extract link targets
-                link_pattern = r'\.\. _([^:]+): (.+)'
-                links = re.findall(link_pattern, app.env.config.rst_prolog)
-                if links:
-                    logger.debug("Found link targets in rst_prolog: %s", links)
-                    for name, target in links:
-                        targets[name] = target
-            
-            # Extract substitutions from html_context
-            if hasattr(app.env.config, 'html_context') and app.env.config.html_context:
-                if 'substitutions' in app.env.config.html_context:
-                    subs = app.env.config.html_context['substitutions']
-                    logger.debug("Found substitutions in html_context: %s", subs)
-                    for name, value in subs.items():
-                        substitutions[name] = value
-                        # Register individual substitution handler
-                        _docutils.register_substitution_handler(name, value)
-            
-            # Register all substitutions and targets with docutils
-            if substitutions or targets:
-                _docutils.register_substitutions_and_targets(substitutions, targets)
-
-    yield app
+    temp_dir = None
+    try:
+        if _extras.SPHINX_INSTALLED:
+            import sphinx.application
+
+            confdir = None
+            if source_file_dir is not None:
+                confdir = find_sphinx_confdir(source_file_dir)
+                logger.debug("Found confdir: %s for source_file_dir: %s", confdir, source_file_dir)
+
+            if confdir is None:
+                _register_default_sphinx_directives_and_roles()
+            else:
+                import tempfile
 
+                temp_dir = pathlib.Path(tempfile.mkdtemp())
+                app = create_dummy_sphinx_app(confdir, temp_dir)
 
-def get_sphinx_directives_and_roles() -> tuple[list[str], list[str]]:
-    """Return Sphinx directives and roles loaded from sphinx.
+            # NOTE: Hack to prevent sphinx warnings for overwriting registered nodes; see #113
+            if not _PATCHED_BUILTIN_EXTENSIONS:
+                sphinx.application.builtin_extensions = tuple(
+                    e for e in sphinx.application.builtin_extensions if e != "sphinx.addnodes"
+                )
+                _PATCHED_BUILTIN_EXTENSIONS = True
+
+            # Extract and register substitutions and link targets from conf.py
+            if app is not None and confdir is not None and hasattr(app.env, 'config'):
+                if confdir not in _PROLOG_CACHE:
+                    _PROLOG_CACHE[confdir] = _extract_substitutions_and_targets(app.env.config)
+                (substitutions, targets) = _PROLOG_CACHE[confdir]
+
+                # Register all substitutions and targets with docutils
+                if substitutions or targets:
+                    _docutils.register_substitutions_and_targets(substitutions, targets)
+
+        yield app
+    finally:
+        if temp_dir is not None:
+            import shutil
+
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sphinx_domain_directives_and_roles() -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return directives and roles of the Sphinx domains.
+
+    The domains' directives and roles are class attributes which do not change during runtime,
+    so the result is cached.
 
     :return: Tuple of directives and roles
     """
-    _extras.install_guard("sphinx")
+    import sphinx.domains.c
+    import sphinx.domains.cpp
+    import sphinx.domains.javascript
+    import sphinx.domains.python
+    import sphinx.domains.std
 
     sphinx_directives = list(sphinx.domains.std.StandardDomain.directives)
     sphinx_roles = list(sphinx.domains.std.StandardDomain.roles)
 
-    for domain in [
+    for domain in (
         sphinx.domains.c.CDomain,
         sphinx.domains.cpp.CPPDomain,
         sphinx.domains.javascript.JavaScriptDomain,
         sphinx.domains.python.PythonDomain,
-    ]:
-        domain_directives = list(domain.directives)
-        domain_roles = list(domain.roles)
+    ):
+        name = domain.name
+        domain_directives = domain.directives
+        domain_roles = domain.roles
 
-        sphinx_directives += domain_directives + [
-            f"{domain.name}:{item}" for item in domain_directives
-        ]
+        sphinx_directives.extend(domain_directives)
+        sphinx_directives.extend(f"{name}:{item}" for item in domain_directives)
 
-        sphinx_roles += domain_roles + [f"{domain.name}:{item}" for item in domain_roles]
+        sphinx_roles.extend(domain_roles)
+        sphinx_roles.extend(f"{name}:{item}" for item in domain_roles)
 
-    sphinx_directives += list(
-        sphinx.util.docutils.directives._directives  # type: ignore[attr-defined]  # noqa: SLF001
-    )
-    sphinx_roles += list(
-        sphinx.util.docutils.roles._roles  # type: ignore[attr-defined]  # noqa: SLF001
-    )
+    return (tuple(map(sys.intern, sphinx_directives)), tuple(map(sys.intern, sphinx_roles)))
+
+
+def get_sphinx_directives_and_roles() -> tuple[list[str], list[str]]:
+    """Return Sphinx directives and roles loaded from sphinx.
+
+    :return: Tuple of directives and roles
+    """
+    _extras.install_guard("sphinx")
+
+    import sphinx.util.docutils
+
+    (domain_directives, domain_roles) = _get_sphinx_domain_directives_and_roles()
+
+    sphinx_directives = [
+        *domain_directives,
+        *sphinx.util.docutils.directives._directives,  # type: ignore[attr-defined]  # noqa: SLF001
+    ]
+    sphinx_roles = [
+        *domain_roles,
+        *sphinx.util.docutils.roles._roles,  # type: ignore[attr-defined]  # noqa: SLF001
+    ]
 
     return (sphinx_directives, sphinx_roles)
 
 
-_DIRECTIVE_WHITELIST = ["code", "code-block", "sourcecode", "include"]
-_ROLE_WHITELIST: list[str] = []
+_DIRECTIVE_WHITELIST = frozenset(("code", "code-block", "sourcecode", "include"))
+_ROLE_WHITELIST: frozenset[str] = frozenset()
 
 
 def filter_whitelisted_directives_and_roles(
@@ -202,18 +378,18 @@ def filter_whitelisted_directives_and_roles(
     :param roles: Roles to filter
     :return: Tuple of filtered directives and roles
     """
-    directives = list(filter(lambda d: d not in _DIRECTIVE_WHITELIST, directives))
-    roles = list(filter(lambda r: r not in _ROLE_WHITELIST, roles))
-
-    return (directives, roles)
+    return (
+        [d for d in directives if d not in _DIRECTIVE_WHITELIST],
+        [r for r in roles if r not in _ROLE_WHITELIST],
+    )
 
 
 def load_sphinx_ignores(app: sphinx.application.Sphinx | None = None) -> None:  # pragma: no cover
     """Register Sphinx directives and roles to ignore.
     
     :param app: Sphinx application instance; defaults to :py:obj:`None`
+    :raises ModuleNotFoundError: When sphinx is not installed.
     """
-    _extras.install_guard("sphinx")
     logger.debug("Load sphinx directives and roles.")
 
     (directives, roles) = get_sphinx_directives_and_roles()
@@ -53,7 +53,7 @@ def check_file(
 ) -> list[types.LintError]:
     """Check the given file for issues.
 
-    On every call docutils' caches for roles and directives are cleared by reloading their modules.
+    On every call docutils' caches for roles and directives are cleared.
 
     :param source_file: Path to file to check
     :param rstcheck_config: Main configuration of the application
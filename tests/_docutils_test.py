@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import docutils.core
 import docutils.parsers.rst.directives as docutils_directives
 import docutils.parsers.rst.roles as docutils_roles
 import pytest
@@ -9,6 +10,54 @@ import pytest
 from rstcheck_core import _docutils, _extras
 
 
+class TestIgnoreRole:
+    """Test ``ignore_role`` function."""
+
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_ignored_role_is_parsed_without_messages() -> None:
+        """Test text with an ignored role is parsed without system messages."""
+        _docutils.ignore_directives_and_roles([], ["test_role"])
+
+        document = docutils.core.publish_doctree(
+            "Some :test_role:`text`.", settings_overrides={"report_level": 5}
+        )  # act
+
+        assert not document.parse_messages
+        assert document.astext() == "Some ."
+
+
+class TestCleanDocutilsDirectivesAndRolesCache:
+    """Test ``clean_docutils_directives_and_roles_cache`` function."""
+
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_registered_directives_and_roles_are_removed() -> None:
+        """Test registered directives and roles are removed."""
+        _docutils.ignore_directives_and_roles(["test_directive"], ["test_role"])
+
+        _docutils.clean_docutils_directives_and_roles_cache()  # act
+
+        assert not docutils_directives._directives  # type: ignore[attr-defined]
+        assert not docutils_roles._roles  # type: ignore[attr-defined]
+
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_canonical_roles_are_restored(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test overwritten canonical roles are restored."""
+        monkeypatch.setattr(
+            "docutils.parsers.rst.roles._role_registry",
+            {"code": _docutils.ignore_role},
+        )
+
+        _docutils.clean_docutils_directives_and_roles_cache()  # act
+
+        assert (
+            docutils_roles._role_registry["code"]  # type: ignore[attr-defined]
+            is _docutils._CANONICAL_ROLES["code"]
+        )
+
+
 class TestIgnoreDirectivesAndRoles:
     """Test ``ignore_directives_and_roles`` function."""
 
@@ -60,6 +109,14 @@ class TestIgnoreDirectivesAndRoles:
         assert "test_directive" in docutils_directives._directives  # type: ignore[attr-defined]
         assert "test_role" in docutils_roles._roles  # type: ignore[attr-defined]
 
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_roles_are_registered_lowercase() -> None:
+        """Test roles are registered by their lowercase name like docutils does."""
+        _docutils.ignore_directives_and_roles([], ["Test_Role"])  # act
+
+        assert "test_role" in docutils_roles._roles  # type: ignore[attr-defined]
+
 
 class TestRegisterCodeRirective:
     """Test ``register_code_directive`` function."""
@@ -139,3 +196,44 @@ class TestRegisterCodeRirective:
         assert "code" not in docutils_directives._directives  # type: ignore[attr-defined]
         assert "code-block" not in docutils_directives._directives  # type: ignore[attr-defined]
         assert "sourcecode" in docutils_directives._directives  # type: ignore[attr-defined]
+
+
+class TestRegisterSubstitutionHandler:
+    """Test ``register_substitution_handler`` function."""
+
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_registers_role(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a role for the substitution is registered."""
+        monkeypatch.setattr(_docutils, "_SUBSTITUTION_TEXT", {})
+
+        _docutils.register_substitution_handler("test_sub", "test text")  # act
+
+        assert "substitution-test_sub" in docutils_roles._roles  # type: ignore[attr-defined]
+
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_roles_resolve_their_own_text(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test every substitution role resolves the text of its substitution."""
+        monkeypatch.setattr(_docutils, "_SUBSTITUTION_TEXT", {})
+        _docutils.register_substitution_handler("sub1", "text 1")
+        _docutils.register_substitution_handler("sub2", "text 2")
+
+        document = docutils.core.publish_doctree(
+            ":substitution-sub1:`x` :substitution-sub2:`x`"
+        )  # act
+
+        assert document.astext() == "text 1 text 2"
+
+    @staticmethod
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_role_resolves_text_through_alias(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a substitution role resolves its text when called through an alias."""
+        monkeypatch.setattr(_docutils, "_SUBSTITUTION_TEXT", {})
+        _docutils.register_substitution_handler("version", "1.0")
+
+        document = docutils.core.publish_doctree(
+            ".. role:: v(substitution-version)\n\n:v:`x`\n"
+        )  # act
+
+        assert document.astext() == "1.0"
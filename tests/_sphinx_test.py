@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pathlib
+import tempfile
+import types
 import typing as t
 
 import docutils.parsers.rst.directives as docutils_directives
@@ -12,6 +15,7 @@ from rstcheck_core import _extras, _sphinx
 
 if _extras.SPHINX_INSTALLED:
     import sphinx.application
+    import sphinx.errors
 
 
 @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
@@ -22,6 +26,126 @@ def test_dummy_app_creator() -> None:
     assert isinstance(result, sphinx.application.Sphinx)
 
 
+class TestSphinxConfdirFinder:
+    """Test ``find_sphinx_confdir`` function."""
+
+    @staticmethod
+    def test_finds_confdir_in_parent(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test conf.py in a parent directory is found."""
+        monkeypatch.setattr(_sphinx, "_POSITIVE_CONFDIR", {})
+        monkeypatch.setattr(_sphinx, "_NEGATIVE_CONFDIR", set())
+        (tmp_path / "conf.py").touch()
+        source_dir = tmp_path / "sub" / "subsub"
+        source_dir.mkdir(parents=True)
+
+        result = _sphinx.find_sphinx_confdir(source_dir)  # act
+
+        assert result == tmp_path.resolve()
+
+    @staticmethod
+    def test_returns_none_without_confdir(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test ``None`` is returned when no conf.py exists in the tree."""
+        monkeypatch.setattr(_sphinx, "_POSITIVE_CONFDIR", {})
+        monkeypatch.setattr(_sphinx, "_NEGATIVE_CONFDIR", {str(tmp_path.resolve())})
+        (tmp_path / "sub").mkdir()
+
+        result = _sphinx.find_sphinx_confdir(tmp_path / "sub")  # act
+
+        assert result is None
+
+    @staticmethod
+    def test_result_is_cached_for_visited_directories(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the result is cached for every directory visited during the search."""
+        monkeypatch.setattr(_sphinx, "_POSITIVE_CONFDIR", {})
+        monkeypatch.setattr(_sphinx, "_NEGATIVE_CONFDIR", set())
+        (tmp_path / "conf.py").touch()
+        source_dir = tmp_path / "sub" / "subsub"
+        source_dir.mkdir(parents=True)
+        _sphinx.find_sphinx_confdir(source_dir)
+        (tmp_path / "conf.py").unlink()
+
+        result = _sphinx.find_sphinx_confdir(tmp_path / "sub")  # act
+
+        assert result == tmp_path.resolve()
+
+    @staticmethod
+    def test_negative_result_is_cached_for_visited_directories(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a negative result is cached for every directory visited during the search."""
+        monkeypatch.setattr(_sphinx, "_POSITIVE_CONFDIR", {})
+        monkeypatch.setattr(_sphinx, "_NEGATIVE_CONFDIR", {str(tmp_path.resolve())})
+        source_dir = tmp_path / "sub" / "subsub"
+        source_dir.mkdir(parents=True)
+        _sphinx.find_sphinx_confdir(source_dir)
+        (tmp_path / "sub" / "conf.py").touch()
+
+        result = _sphinx.find_sphinx_confdir(tmp_path / "sub")  # act
+
+        assert result is None
+
+
+class TestSubstitutionAndTargetExtractor:
+    """Test ``_extract_substitutions_and_targets`` function."""
+
+    @staticmethod
+    def test_extracts_from_rst_prolog() -> None:
+        """Test substitutions and link targets are extracted from ``rst_prolog``."""
+        sphinx_config = types.SimpleNamespace(
+            rst_prolog=".. |build| replace:: Build\n.. _build: https://example.com\n",
+            html_context={},
+        )
+
+        (substitutions, targets) = _sphinx._extract_substitutions_and_targets(
+            sphinx_config  # type: ignore[arg-type]
+        )  # act
+
+        assert substitutions == {"build": "Build"}
+        assert targets == {"build": "https://example.com"}
+
+    @staticmethod
+    def test_extracts_interleaved_rst_prolog_lines() -> None:
+        """Test interleaved substitutions and link targets are extracted line by line."""
+        sphinx_config = types.SimpleNamespace(
+            rst_prolog=(
+                ".. _one: https://example.com/1\n"
+                ".. |one| replace:: One\n"
+                "\n"
+                ".. _label:\n"
+                ".. |two| replace:: Two: 2\n"
+                ".. _two: https://example.com/2\n"
+            ),
+            html_context={},
+        )
+
+        (substitutions, targets) = _sphinx._extract_substitutions_and_targets(
+            sphinx_config  # type: ignore[arg-type]
+        )  # act
+
+        assert substitutions == {"one": "One", "two": "Two: 2"}
+        assert targets == {"one": "https://example.com/1", "two": "https://example.com/2"}
+
+    @staticmethod
+    def test_extracts_from_html_context() -> None:
+        """Test substitutions are extracted from ``html_context``."""
+        sphinx_config = types.SimpleNamespace(
+            rst_prolog="", html_context={"substitutions": {"build": "Build"}}
+        )
+
+        (substitutions, targets) = _sphinx._extract_substitutions_and_targets(
+            sphinx_config  # type: ignore[arg-type]
+        )  # act
+
+        assert substitutions == {"build": "Build"}
+        assert not targets
+
+
 class TestContextManager:
     """Test ``load_sphinx_if_available`` context manager."""
 
@@ -46,6 +170,82 @@ class TestContextManager:
             assert docutils_roles._roles  # type: ignore[attr-defined]
             assert "sphinx.addnodes" not in sphinx.application.builtin_extensions
 
+    @staticmethod
+    @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_app_without_confdir_is_created_once(monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the dummy app for directories without conf.py is only created once."""
+        monkeypatch.setattr(_sphinx, "_DEFAULT_SPHINX_REGISTRATIONS", None)
+        create_dummy_sphinx_app = _sphinx.create_dummy_sphinx_app
+        created_apps: list[sphinx.application.Sphinx] = []
+
+        def _counting_create_dummy_sphinx_app(
+            *args: pathlib.Path | None,
+        ) -> sphinx.application.Sphinx:
+            created_apps.append(create_dummy_sphinx_app(*args))
+            return created_apps[-1]
+
+        monkeypatch.setattr(_sphinx, "create_dummy_sphinx_app", _counting_create_dummy_sphinx_app)
+
+        with _sphinx.load_sphinx_if_available():
+            pass
+        docutils_directives._directives.clear()  # type: ignore[attr-defined]
+        docutils_roles._roles.clear()  # type: ignore[attr-defined]
+
+        with _sphinx.load_sphinx_if_available() as ctx_manager:  # act
+            assert ctx_manager is None
+            assert docutils_directives._directives  # type: ignore[attr-defined]
+            assert docutils_roles._roles  # type: ignore[attr-defined]
+        assert len(created_apps) == 1
+
+    @staticmethod
+    @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_registrations_are_restored_when_app_creation_fails(
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test registered directives and roles are restored when the app creation fails."""
+        monkeypatch.setattr(_sphinx, "_DEFAULT_SPHINX_REGISTRATIONS", None)
+
+        def _failing_create_dummy_sphinx_app(
+            *args: pathlib.Path | None,
+        ) -> sphinx.application.Sphinx:
+            raise RuntimeError
+
+        monkeypatch.setattr(_sphinx, "create_dummy_sphinx_app", _failing_create_dummy_sphinx_app)
+        docutils_directives._directives["test-directive"] = "test"  # type: ignore[attr-defined]
+        docutils_roles._roles["test-role"] = "test"  # type: ignore[attr-defined]
+
+        with pytest.raises(RuntimeError):
+            _sphinx._register_default_sphinx_directives_and_roles()  # act
+
+        assert docutils_directives._directives == {"test-directive": "test"}  # type: ignore[attr-defined]
+        assert docutils_roles._roles == {"test-role": "test"}  # type: ignore[attr-defined]
+        assert _sphinx._DEFAULT_SPHINX_REGISTRATIONS is None
+
+    @staticmethod
+    @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
+    @pytest.mark.usefixtures("patch_docutils_directives_and_roles_dict")
+    def test_temp_dir_is_removed_when_app_creation_fails(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the temporary directory is removed when the conf.py raises."""
+        monkeypatch.setattr(_sphinx, "_POSITIVE_CONFDIR", {})
+        monkeypatch.setattr(_sphinx, "_NEGATIVE_CONFDIR", set())
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / "conf.py").write_text("raise RuntimeError\n")
+        temp_root = tmp_path / "tmp"
+        temp_root.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(temp_root))
+
+        context_manager = _sphinx.load_sphinx_if_available(project_dir)
+
+        with pytest.raises(sphinx.errors.ConfigError), context_manager:  # act
+            pass
+
+        assert not list(temp_root.iterdir())
+
 
 class TestSphinxDirectiveAndRoleGetter:
     """Test ``get_sphinx_directives_and_roles`` function."""
@@ -119,6 +319,18 @@ class TestSphinxDirectiveAndRoleGetter:
         assert "test-directive" in result_directives
         assert "test-role" in result_roles
 
+    @staticmethod
+    @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
+    def test_domain_directives_and_roles_are_cached() -> None:
+        """Test the domains' directives and roles are only collected once."""
+        _sphinx.get_sphinx_directives_and_roles()
+        hits_before = _sphinx._get_sphinx_domain_directives_and_roles.cache_info().hits
+
+        _sphinx.get_sphinx_directives_and_roles()  # act
+
+        hits_after = _sphinx._get_sphinx_domain_directives_and_roles.cache_info().hits
+        assert hits_after == hits_before + 1
+
 
 class TestDirectiveAndRoleFilter:
     """Test ``filter_whitelisted_directives_and_roles`` function."""
@@ -127,7 +339,7 @@ class TestDirectiveAndRoleFilter:
     @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
     def test_directives_are_filtered(monkeypatch: pytest.MonkeyPatch) -> None:
         """Test directives are filtered."""
-        monkeypatch.setattr(_sphinx, "_DIRECTIVE_WHITELIST", ["test-directive"])
+        monkeypatch.setattr(_sphinx, "_DIRECTIVE_WHITELIST", frozenset({"test-directive"}))
         unfiltered_directives = ["test-directive", "test-directive2"]
 
         (result_directives, _) = _sphinx.filter_whitelisted_directives_and_roles(
@@ -155,7 +367,7 @@ class TestDirectiveAndRoleFilter:
     @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
     def test_roles_are_filtered(monkeypatch: pytest.MonkeyPatch) -> None:
         """Test roles are filtered."""
-        monkeypatch.setattr(_sphinx, "_ROLE_WHITELIST", ["test-role"])
+        monkeypatch.setattr(_sphinx, "_ROLE_WHITELIST", frozenset({"test-role"}))
         unfiltered_roles = ["test-role", "test-role2"]
 
         (_, result_roles) = _sphinx.filter_whitelisted_directives_and_roles(
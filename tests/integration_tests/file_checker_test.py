@@ -10,7 +10,7 @@ import typing as t
 
 import pytest
 
-from rstcheck_core import _extras, checker, config
+from rstcheck_core import _extras, _sphinx, checker, config
 from tests.conftest import EXAMPLES_DIR
 
 
@@ -306,6 +306,26 @@ class TestSphinx:
 
         assert not result
 
+    @staticmethod
+    @pytest.mark.skipif(not _extras.SPHINX_INSTALLED, reason="Depends on sphinx extra.")
+    def test_sphinx_code_role_is_used_for_consecutive_files_without_confdir(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test Sphinx's ``code`` role is used for every file checked without a conf.py."""
+        monkeypatch.setattr(_sphinx, "_POSITIVE_CONFDIR", {})
+        monkeypatch.setattr(_sphinx, "_NEGATIVE_CONFDIR", {str(tmp_path.resolve())})
+        monkeypatch.setattr(_sphinx, "_DEFAULT_SPHINX_REGISTRATIONS", None)
+        test_files = [tmp_path / "first.rst", tmp_path / "second.rst"]
+        for test_file in test_files:
+            test_file.write_text(
+                ".. role:: foo(code)\n   :language: nonexistentlang\n\n:foo:`x`\n", "utf-8"
+            )
+        init_config = config.RstcheckConfig()
+
+        results = [checker.check_file(test_file, init_config) for test_file in test_files]  # act
+
+        assert results == [[], []]
+
 
 class TestInlineIgnoreComments:
     """Test inline config comments to ignore things."""